@@ -1,5 +1,13 @@
-from .searcher import PackageSearcher
-from .models import PackageInfo
-
 __version__ = "0.1.1"
-__all__ = ['PackageSearcher', 'PackageInfo']
\ No newline at end of file
+__all__ = ['PackageSearcher', 'PackageInfo']
+
+def __getattr__(name):
+    # Imported lazily so the CLI can parse arguments (and print --help)
+    # without first importing every repository module and requests
+    if name == 'PackageSearcher':
+        from .searcher import PackageSearcher
+        return PackageSearcher
+    if name == 'PackageInfo':
+        from .models import PackageInfo
+        return PackageInfo
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
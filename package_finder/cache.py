@@ -0,0 +1,49 @@
+import gzip
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Default lifetime of on-disk cache entries (24 hours)
+DEFAULT_TTL = 24 * 60 * 60
+
+def get_cache_dir() -> Path:
+    """Get the package_finder cache directory, honouring XDG_CACHE_HOME."""
+    base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base_dir) / 'package_finder'
+
+def load_cached_json(name: str, ttl: float = DEFAULT_TTL) -> Optional[Any]:
+    """
+    Load a cached JSON document by name.
+    Returns None if the entry is missing, unreadable or older than ttl seconds.
+    """
+    path = get_cache_dir() / f"{name}.json.gz"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, EOFError, ValueError):
+        # EOFError: a truncated gzip file
+        return None
+
+def save_cached_json(name: str, data: Any) -> None:
+    """Store a JSON-serializable document in the cache. Failures are ignored."""
+    path = get_cache_dir() / f"{name}.json.gz"
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file, so concurrent writers of the same entry don't interleave
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+        with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+            json.dump(data, f)
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
@@ -1,25 +1,27 @@
 import argparse
+import logging
 import sys
-from .searcher import PackageSearcher, print_package_info
 
 def main():
     parser = argparse.ArgumentParser(description='Search for packages across multiple repositories')
     parser.add_argument('package_names', nargs='+', help='Names of packages to search for')
+    parser.add_argument('--debug', action='store_true', help='Print debug messages from the repositories')
     args = parser.parse_args()
     
+    if args.debug:
+        logging.basicConfig(format='[%(name)s] %(message)s')
+        logging.getLogger('package_finder').setLevel(logging.DEBUG)
+    
+    # Deferred so --help and usage errors don't pay for importing every repository
+    from .searcher import PackageSearcher, print_search_results
+    
     searcher = PackageSearcher()
     results = searcher.search_packages(args.package_names)
     
-    for package_name, package_results in results.items():
-        if package_results:
-            print(f"\nFound '{package_name}' in {len(package_results)} repositories:")
-            for result in package_results:
-                print_package_info(result)
-        else:
-            print(f"\n❌ Package '{package_name}' was not found in any repository.")
+    print_search_results(results)
     
     # Return non-zero if any package wasn't found
     return 0 if all(bool(results[pkg]) for pkg in args.package_names) else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
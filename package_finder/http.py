@@ -0,0 +1,86 @@
+import sqlite3
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from . import __version__
+from .cache import get_cache_dir
+
+try:
+    # Optional: persistent HTTP cache with ETag/Last-Modified revalidation
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    # Optional: faster JSON decoding for the large listing responses
+    import orjson
+except ImportError:
+    orjson = None
+
+# Default freshness of cached HTTP responses when the server sends no Cache-Control (1 hour)
+HTTP_CACHE_EXPIRE_AFTER = 60 * 60
+
+def _create_cached_session() -> requests.Session:
+    """Create a requests-cache session backed by an sqlite file in the cache directory."""
+    cache_dir = get_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return requests_cache.CachedSession(
+        str(cache_dir / 'http_cache'),
+        backend='sqlite',
+        expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        # Cache misses and HEAD probes too, so name variants that don't exist aren't re-probed
+        allowable_codes=(200, 404),
+        allowable_methods=('GET', 'HEAD'),
+        # Fall back to an expired response if the server can't be reached
+        stale_if_error=True,
+        cache_control=True
+    )
+
+def create_session() -> requests.Session:
+    """
+    Create a requests session with pooled keep-alive connections.
+    Safe to share between the searcher's worker threads for GET/HEAD requests.
+    If requests-cache is installed, responses are also cached on disk and
+    stale entries are revalidated with conditional requests (304 Not Modified).
+    If the cache database can't be opened, an uncached session is used instead.
+    """
+    session = None
+    if requests_cache is not None:
+        try:
+            session = _create_cached_session()
+        except (OSError, sqlite3.Error):
+            # e.g. an unwritable cache directory
+            pass
+    if session is None:
+        session = requests.Session()
+    
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+    session.headers['User-Agent'] = f"package-finder/{__version__} {session.headers['User-Agent']}"
+    return session
+
+def parse_json(response: requests.Response):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    Invalid bodies raise the same exception as response.json().
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+# Shared by all repositories unless one is given its own session
+SESSION = create_session()
@@ -1,7 +1,11 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PackageInfo:
     """Standardized package information across different sources."""
     name: str
@@ -12,7 +16,7 @@ class PackageInfo:
     latest_version: Optional[str] = None
     license: Optional[str] = None
     thread_support: Optional[bool] = None
-    thread_flags: Optional[List[str]] = None
+    thread_flags: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict:
         """Convert PackageInfo to dictionary."""
@@ -24,5 +28,5 @@ class PackageInfo:
             'latest_version': self.latest_version,
             'license': self.license,
             'thread_support': self.thread_support,
-            'thread_flags': self.thread_flags or []
+            'thread_flags': list(self.thread_flags)
         }
\ No newline at end of file
@@ -1,12 +1,62 @@
 from abc import ABC, abstractmethod
+import functools
 import re
-from typing import Optional, List
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterable
 import unicodedata
 from ..models import PackageInfo
+from ..http import SESSION
+
+# Per-repository search results, kept for an hour so repeated lookups skip the network
+_SEARCH_CACHE_TTL = 60 * 60
+_SEARCH_CACHE_SIZE = 1024
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+_NORMALIZE_TABLE = str.maketrans({'ı': 'i', 'İ': 'i'})
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+def memoize_search(search_package):
+    """
+    Decorator caching a repository's search_package results per instance.
+    Entries expire after _SEARCH_CACHE_TTL seconds. None is not cached, since
+    repositories also return it when a request fails.
+    """
+    @functools.wraps(search_package)
+    def wrapper(self, package_name: str) -> Optional[PackageInfo]:
+        with _SEARCH_CACHE_LOCK:
+            cache = self.__dict__.setdefault('_search_cache', OrderedDict())
+            cached = cache.get(package_name)
+            if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL:
+                cache.move_to_end(package_name)
+                return cached[1]
+        
+        result = search_package(self, package_name)
+        if result is None:
+            return None
+        
+        with _SEARCH_CACHE_LOCK:
+            cache[package_name] = (time.monotonic(), result)
+            cache.move_to_end(package_name)
+            while len(cache) > _SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        return result
+    
+    return wrapper
 
 class PackageRepository(ABC):
     """Abstract base class for package repositories."""
     
+    # HTTP session used for all requests; shared so connections are reused
+    session = SESSION
+    
+    # Side requests a search runs alongside its main one (versions, readmes,
+    # archive listings, URL probes); one pool shared by every repository
+    _fetch_executor = ThreadPoolExecutor(max_workers=32)
+    
     @abstractmethod
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         """Search for a package in the repository."""
@@ -22,32 +72,28 @@ class PackageRepository(ABC):
         Normalize package name for case-insensitive comparison.
         Uses a more thorough approach for special characters.
         """
-        # Convert to lowercase
-        package_name = package_name.lower()
-        
-        # Replace Turkish characters specifically
-        package_name = package_name.replace('ı', 'i')
-        package_name = package_name.replace('İ', 'i') 
-        package_name = package_name.replace('I', 'i')
+        # Most names are plain ASCII and only need lowercasing
+        if package_name.isascii():
+            return _NON_ALNUM_RE.sub('', package_name.lower())
         
-        # Normalize to decomposed form and remove diacritics
+        # Map Turkish dotless/dotted i, case-fold, then decompose so diacritics
+        # become separate combining characters that the final filter drops
+        package_name = package_name.translate(_NORMALIZE_TABLE).casefold()
         package_name = unicodedata.normalize('NFD', package_name)
-        package_name = ''.join(c for c in package_name if not unicodedata.combining(c))
         
         # Remove any remaining special characters, just keep alphanumeric
-        package_name = re.sub(r'[^a-z0-9]', '', package_name)
-        
-        return package_name
+        return _NON_ALNUM_RE.sub('', package_name)
     
+    def _build_case_map(self, available_packages: Iterable[str]) -> Dict[str, str]:
+        """
+        Build a {normalized_name: name} map for a package listing.
+        Callers keep the map next to their listing, so it is only built once.
+        """
+        return {self._normalize_package_name(pkg): pkg for pkg in available_packages}
     
-    def _find_case_insensitive_match(self, package_name: str, available_packages: List[str]) -> Optional[str]:
+    def _find_case_insensitive_match(self, package_name: str, package_map: Dict[str, str]) -> Optional[str]:
         """
-        Find a case-insensitive match for the package name.
+        Find a case-insensitive match for the package name in a map from _build_case_map.
         Returns the correct case if found, None otherwise.
         """
-        package_lower = self._normalize_package_name(package_name)
-
-        package_map = {self._normalize_package_name(pkg): pkg for pkg in available_packages}
-        return package_map.get(package_lower)
-    
-    
\ No newline at end of file
+        return package_map.get(self._normalize_package_name(package_name))
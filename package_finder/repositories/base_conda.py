@@ -1,7 +1,10 @@
 import requests
-from typing import Optional
-from .base import PackageRepository
-from .utils import find_thread_flags
+import threading
+from typing import Optional, Dict, Set
+from .base import PackageRepository, memoize_search
+from .utils import find_thread_flags, version_sort_key
+from ..cache import load_cached_json, save_cached_json
+from ..http import parse_json
 from ..models import PackageInfo
 
 class BaseAnacondaRepository(PackageRepository):
@@ -16,18 +19,78 @@ class BaseAnacondaRepository(PackageRepository):
         """
         self.channel = channel
         self.base_url = f"https://api.anaconda.org/package/{channel}"
+        self._channel_index: Optional[Dict[str, str]] = None
+        self._channel_names: Set[str] = set()
+        # Whether the index was downloaded in this process rather than read from the disk cache
+        self._channel_index_fresh = False
+        self._channel_index_lock = threading.Lock()
     
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         """
-        Wrapper for search package helper that tries both the package name and 'bioconductor-' + package name.
-        """  
-        exact_name_result = self.search_package_helper(package_name)
-        bioconductor_result = self.search_package_helper("bioconductor-" + package_name)
-
-        if bioconductor_result != None:
-            return bioconductor_result
-        else:
-            return exact_name_result
+        Search for the package, preferring its 'bioconductor-' + package name build.
+        Both names are resolved against the channel index first. A freshly downloaded
+        index is trusted to rule names out; with a disk-cached one, which may be up to
+        a day old, names it doesn't list are still requested directly.
+        """
+        candidates = ["bioconductor-" + package_name, package_name]
+        
+        channel_index = self._load_channel_index()
+        if channel_index:
+            unlisted = []
+            for candidate in candidates:
+                # Exact names first: distinct names like typing_extensions and
+                # typing-extensions share a normalized key
+                if candidate in self._channel_names:
+                    correct_name = candidate
+                else:
+                    correct_name = channel_index.get(self._normalize_package_name(candidate))
+                if correct_name:
+                    result = self.search_package_helper(correct_name)
+                    if result is not None:
+                        return result
+                else:
+                    unlisted.append(candidate)
+            
+            if self._channel_index_fresh:
+                return None
+            candidates = unlisted
+        
+        # Without an up-to-date index, probe each name directly
+        for candidate in candidates:
+            result = self.search_package_helper(candidate)
+            if result is not None:
+                return result
+        return None
+    
+    def _load_channel_index(self) -> Dict[str, str]:
+        """
+        Load the channel's package names as a {normalized_name: name} index;
+        the exact names are kept in _channel_names.
+        The listing is large, so it is fetched at most once per process and
+        kept on disk for a day.
+        """
+        with self._channel_index_lock:
+            if self._channel_index is None:
+                cache_name = f"anaconda-{self.channel}-packages"
+                available_packages = load_cached_json(cache_name)
+                if available_packages is None:
+                    try:
+                        list_response = self.session.get(f"https://api.anaconda.org/package/{self.channel}/", timeout=30)
+                        if list_response.status_code == 200:
+                            available_packages = [pkg['name'] for pkg in parse_json(list_response)]
+                            save_cached_json(cache_name, available_packages)
+                            self._channel_index_fresh = True
+                    except requests.RequestException:
+                        pass
+                
+                # Leave the index unset on failure so a later search can retry
+                if available_packages is None:
+                    return {}
+                self._channel_names = set(available_packages)
+                self._channel_index = self._build_case_map(available_packages)
+            
+            return self._channel_index
     
     def search_package_helper(self, package_name: str) -> Optional[PackageInfo]:
         """
@@ -41,22 +104,17 @@ class BaseAnacondaRepository(PackageRepository):
         """
         try:
             # Try exact match
-            response = requests.get(f"{self.base_url}/{package_name}")
+            response = self.session.get(f"{self.base_url}/{package_name}", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
             else:
-                # If exact match fails, get package list and try case-insensitive match
-                list_response = requests.get(f"https://api.anaconda.org/package/{self.channel}/")
-                if list_response.status_code == 200:
-                    available_packages = [pkg['name'] for pkg in list_response.json()]
-                    correct_name = self._find_case_insensitive_match(package_name, available_packages)
-                    if correct_name:
-                        response = requests.get(f"{self.base_url}/{correct_name}")
-                        if response.status_code == 200:
-                            data = response.json()
-                            package_name = correct_name  # Use the correct case
-                        else:
-                            return None
+                # If exact match fails, try a case-insensitive match against the channel index
+                correct_name = self._load_channel_index().get(self._normalize_package_name(package_name))
+                if correct_name and correct_name != package_name:
+                    response = self.session.get(f"{self.base_url}/{correct_name}", timeout=10)
+                    if response.status_code == 200:
+                        data = parse_json(response)
+                        package_name = correct_name  # Use the correct case
                     else:
                         return None
                 else:
@@ -71,10 +129,7 @@ class BaseAnacondaRepository(PackageRepository):
             has_threading, thread_flags = find_thread_flags(description, readme)
             
             # Sort versions properly
-            versions = sorted(data.get('versions', []),
-                          key=lambda x: [int(y) for y in x.split('.')] 
-                          if all(y.isdigit() for y in x.split('.')) 
-                          else [0])
+            versions = sorted(data.get('versions', []), key=version_sort_key)
             
             return PackageInfo(
                 name=package_name,
@@ -0,0 +1,114 @@
+from abc import abstractmethod
+import requests
+import threading
+from typing import Optional, List, Dict
+from .base import PackageRepository, memoize_search
+from .utils import find_thread_flags, version_sort_key
+from ..http import parse_json
+from ..models import PackageInfo
+
+class BaseRPackageRepository(PackageRepository):
+    """Base class for R package APIs with a JSON package listing (Posit, rOpenSci)."""
+    
+    def __init__(self, base_url: str):
+        """
+        Initialize the repository with its API root.
+        
+        Args:
+            base_url (str): API URL serving /packages and /packages/<name>
+        """
+        self.base_url = base_url
+        self._package_map: Optional[Dict[str, str]] = None
+        self._package_map_lock = threading.Lock()
+    
+    @abstractmethod
+    def _versions_url(self, package_name: str) -> str:
+        """URL of the JSON list of a package's versions."""
+        pass
+    
+    @abstractmethod
+    def _package_url(self, package_name: str) -> str:
+        """URL reported for a package in search results."""
+        pass
+    
+    def _load_package_map(self) -> Dict[str, str]:
+        """
+        Load all package names as a {normalized_name: name} map,
+        fetching the listing at most once per process.
+        """
+        with self._package_map_lock:
+            if self._package_map is None:
+                try:
+                    list_response = self.session.get(f"{self.base_url}/packages", timeout=10)
+                    if list_response.status_code != 200:
+                        return {}
+                    self._package_map = self._build_case_map(pkg['Package'] for pkg in parse_json(list_response))
+                except requests.RequestException:
+                    # Leave the map unset so a later search can retry
+                    return {}
+            
+            return self._package_map
+    
+    def _fetch_versions(self, package_name: str) -> List[str]:
+        """Get all versions of a package, sorted."""
+        versions_response = self.session.get(self._versions_url(package_name), timeout=10)
+        versions = []
+        if versions_response.status_code == 200:
+            versions_data = parse_json(versions_response)
+            versions = [v['Version'] for v in versions_data if v.get('Version')]
+        
+        # Sort versions properly, dropping duplicate entries
+        return sorted(dict.fromkeys(versions), key=version_sort_key)
+    
+    @memoize_search
+    def search_package(self, package_name: str) -> Optional[PackageInfo]:
+        try:
+            # The versions don't depend on the package details, so fetch them alongside
+            versions_future = self._fetch_executor.submit(self._fetch_versions, package_name)
+            
+            # First try exact match
+            response = self.session.get(f"{self.base_url}/packages/{package_name}", timeout=10)
+            if response.status_code == 200:
+                data = parse_json(response)
+            else:
+                # If exact match fails, try case-insensitive search
+                package_map = self._load_package_map()
+                if package_map:
+                    correct_name = self._find_case_insensitive_match(package_name, package_map)
+                    if correct_name:
+                        response = self.session.get(f"{self.base_url}/packages/{correct_name}", timeout=10)
+                        if response.status_code == 200:
+                            data = parse_json(response)
+                            package_name = correct_name
+                            versions_future.cancel()
+                            versions_future = self._fetch_executor.submit(self._fetch_versions, package_name)
+                        else:
+                            return None
+                    else:
+                        return None
+                else:
+                    return None
+            
+            # Get package details
+            description = data.get('Description', '')
+            
+            # Get all versions
+            versions = versions_future.result()
+            
+            # Check for threading support
+            has_threading, thread_flags = find_thread_flags(description)
+            
+            return PackageInfo(
+                name=package_name,
+                versions=versions,
+                repository=self.get_repository_name(),
+                url=self._package_url(package_name),
+                description=description,
+                latest_version=data.get('Version'),
+                license=data.get('License'),
+                thread_support=has_threading,
+                thread_flags=thread_flags
+            )
+        
+        except requests.RequestException:
+            return None
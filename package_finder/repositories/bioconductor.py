@@ -1,50 +1,67 @@
 import requests
-import concurrent.futures
-from typing import Dict, Any, Optional, List, Tuple
-from bs4 import BeautifulSoup
-from .base import PackageRepository
-from .utils import find_thread_flags
+import re
+import threading
+from typing import Dict, Any, Optional, Tuple
+from .base import PackageRepository, memoize_search
+from .utils import find_thread_flags, HTML_PARSER
+from ..cache import load_cached_json, save_cached_json
+from ..http import parse_json
 from ..models import PackageInfo
 
+# Package links in the HTML index, e.g. <td><a href="html/limma.html?package=limma">
+_PACKAGE_LINK_RE = re.compile(r'<td><a href="html/[^"]*package=([^"&]+)')
+
+# "Version: x" / "License: y" lines on a package's HTML page
+_VERSION_TEXT_RE = re.compile(r'Version:[ \t]*(\S+)')
+_LICENSE_TEXT_RE = re.compile(r'License:[ \t]*([^\n]*)')
+
+# Debian control format used by VIEWS/PACKAGES: "Key: value" plus indented continuation lines
+_DCF_RECORD_SEPARATOR_RE = re.compile(r'\n[ \t\r]*\n')
+_DCF_FIELD_RE = re.compile(r'^([A-Za-z][\w./@-]*):[ \t]*(.*(?:\n[ \t]+.*)*)', re.MULTILINE)
+
+_RELEASE_INDEX_CACHE_NAME = 'bioconductor-release-index'
+
+# The only index fields search_package reads; everything else is dropped after parsing
+_INDEX_FIELDS = ('Package', 'Title', 'Version', 'License')
+
+# All Bioconductor releases, from 1.6 (Spring 2005) to 3.22 (Fall 2025)
+_BIOC_VERSIONS: Tuple[str, ...] = (
+    '1.6', '1.7', '1.8', '1.9',
+    '2.0', '2.1', '2.2', '2.3', '2.4', '2.5', '2.6', '2.7', '2.8', '2.9',
+    '2.10', '2.11', '2.12', '2.13', '2.14',
+    '3.0', '3.1', '3.2', '3.3', '3.4', '3.5', '3.6', '3.7', '3.8', '3.9',
+    '3.10', '3.11', '3.12', '3.13', '3.14', '3.15', '3.16', '3.17', '3.18', '3.19',
+    '3.20', '3.21', '3.22'
+)
+
 class BioconductorRepository(PackageRepository):
     """Bioconductor package repository supporting multiple versions."""
     
     def __init__(self):
-        # Calculate all Bioconductor versions from 2005 to 2025
-        self.versions = self._calculate_bioc_versions()
+        # All Bioconductor versions from 2005 to 2025
+        self.versions = _BIOC_VERSIONS
         self._packages_cache: Dict[str, Dict[str, Any]] = {}
-    
-    def _calculate_bioc_versions(self) -> List[str]:
-        """Calculate all Bioconductor versions from 2005 to present."""
-        versions = []
-        
-        # Starting with Bioconductor 1.6 (Spring 2005)
-        major_version = 1
-        minor_version = 6
-        
-        # Generate versions up to present
-        for year in range(2005, 2026):
-            # Spring release (April)
-            versions.append(f"{major_version}.{minor_version}")
-            minor_version += 1
-            
-            # Fall release (October)
-            versions.append(f"{major_version}.{minor_version}")
-            minor_version += 1
-            
-            # Increment major version if needed
-            if minor_version > 9:
-                major_version += 1
-                minor_version = 0
-        
-        return versions
+        self._packages_cache_lock = threading.Lock()
+        self._release_index: Optional[Dict[str, Any]] = None
+        self._release_index_map: Dict[str, str] = {}
+        self._release_index_lock = threading.Lock()
     
     def get_repository_name(self) -> str:
         return "Bioconductor"
     
     def _load_packages(self, version: str) -> Dict[str, Any]:
         """Load and cache package information for a specific version."""
-        if version not in self._packages_cache:
+        # Fast path without the lock once the version is cached
+        packages = self._packages_cache.get(version)
+        if packages is not None:
+            return packages
+        
+        with self._packages_cache_lock:
+            # Another thread may have loaded it while we waited
+            if version in self._packages_cache:
+                return self._packages_cache[version]
+            
+            packages = {}
             try:
                 urls = [
                     f"https://bioconductor.org/packages/release/bioc/VIEWS",  # Try current release first
@@ -55,44 +72,74 @@ class BioconductorRepository(PackageRepository):
                 
                 for url in urls:
                     try:
-                        response = requests.get(url)
+                        response = self.session.get(url, timeout=15)
                         response.raise_for_status()
                         if url.endswith('.json'):
-                            self._packages_cache[version] = response.json()
-                            break
+                            packages = parse_json(response)
                         elif url.endswith('VIEWS') or url.endswith('PACKAGES'):
-                            packages = {}
-                            current_package = {}
-                            for line in response.text.split('\n'):
-                                if line.startswith('Package:'):
-                                    if current_package and 'Package' in current_package:
-                                        packages[current_package['Package']] = current_package
-                                    current_package = {'Package': line.split(': ')[1].strip()}
-                                elif ': ' in line:
-                                    key, value = line.split(': ', 1)
-                                    current_package[key.strip()] = value.strip()
-                            if current_package and 'Package' in current_package:
-                                packages[current_package['Package']] = current_package
-                            self._packages_cache[version] = packages
-                            break
+                            packages = self._parse_dcf_records(response.text)
                         else:
-                            packages = {}
-                            for line in response.text.split('\n'):
-                                if '<td><a href="html/' in line and 'package=' in line:
-                                    pkg_name = line.split('package=')[1].split('"')[0]
-                                    packages[pkg_name] = {'Package': pkg_name}
-                            self._packages_cache[version] = packages
-                            break
+                            packages = {
+                                pkg_name: {'Package': pkg_name}
+                                for pkg_name in _PACKAGE_LINK_RE.findall(response.text)
+                            }
+                        break
                     except requests.RequestException:
                         continue
                 
-                if version not in self._packages_cache:
-                    self._packages_cache[version] = {}
-                    
+                packages = self._trim_index(packages)
             except Exception as e:
-                self._packages_cache[version] = {}
-        
-        return self._packages_cache[version]
+                packages = {}
+            
+            # Publish only the finished, trimmed index; leave a failed load
+            # uncached so a later search can retry
+            if packages:
+                self._packages_cache[version] = packages
+            return packages
+    
+    def _parse_dcf_records(self, text: str) -> Dict[str, Dict[str, str]]:
+        """
+        Parse a Debian-control-format index (VIEWS, PACKAGES) into {name: fields}.
+        Records are separated by blank lines; continuation lines are folded.
+        """
+        packages = {}
+        for record in _DCF_RECORD_SEPARATOR_RE.split(text):
+            fields = {
+                key: ' '.join(value.split())
+                for key, value in _DCF_FIELD_RE.findall(record)
+            }
+            if 'Package' in fields:
+                packages[fields['Package']] = fields
+        return packages
+    
+    def _trim_index(self, packages: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+        """Keep only the fields search_package reads from each package record."""
+        return {
+            pkg_name: {field: pkg_info[field] for field in _INDEX_FIELDS if field in pkg_info}
+            for pkg_name, pkg_info in packages.items()
+            if isinstance(pkg_info, dict)
+        }
+    
+    def _load_release_index(self) -> Dict[str, Any]:
+        """
+        Load the current release's package index.
+        A copy is kept on disk for a day so later runs skip the download.
+        """
+        with self._release_index_lock:
+            if self._release_index is None:
+                release_index = load_cached_json(_RELEASE_INDEX_CACHE_NAME)
+                if release_index is None:
+                    release_index = self._load_packages(self.versions[-1])
+                    if release_index:
+                        save_cached_json(_RELEASE_INDEX_CACHE_NAME, release_index)
+                
+                # Leave the index unset on failure so a later search can retry
+                if not release_index:
+                    return {}
+                self._release_index_map = self._build_case_map(release_index)
+                self._release_index = release_index
+            
+            return self._release_index
     
     def _extract_package_info_from_html(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -106,31 +153,27 @@ class BioconductorRepository(PackageRepository):
         """
         try:
             # print(f"Attempting to extract package info from {url}")
-            response = requests.get(url, timeout=15)
+            response = self.session.get(url, timeout=15)
             
             if response.status_code != 200:
                 print(f"Failed to access {url} (Status: {response.status_code})")
                 return None
                 
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Parse the HTML; bs4 is imported here since most searches never need it
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Get the package title/description
             title_element = soup.find('h1')
             description = title_element.text.strip() if title_element else ""
             
-            # Get the version
-            version_info = soup.find(string=lambda text: text and 'Version:' in text)
-            version = ""
-            if version_info:
-                version_text = version_info.strip()
-                version = version_text.split('Version:')[1].strip().split()[0]
+            # Get the version and license from the page text in one pass each
+            page_text = soup.get_text('\n')
+            version_match = _VERSION_TEXT_RE.search(page_text)
+            version = version_match.group(1) if version_match else ""
             
-            # Get the license
-            license_info = soup.find(string=lambda text: text and 'License:' in text)
-            license_text = ""
-            if license_info:
-                license_text = license_info.strip().split('License:')[1].strip()
+            license_match = _LICENSE_TEXT_RE.search(page_text)
+            license_text = license_match.group(1).strip() if license_match else ""
             
             # Get the readme/description
             readme = ""
@@ -167,6 +210,8 @@ class BioconductorRepository(PackageRepository):
     def _find_package_by_direct_url(self, package_name: str) -> Tuple[Optional[Dict[str, Any]], str]:
         """
         Try to find a package by directly accessing its HTML page URL.
+        search_package answers names in the release index itself, so when the
+        index is loaded only the non-software and devel URL patterns are probed.
         
         Args:
             package_name: Name of the package to search for
@@ -174,22 +219,29 @@ class BioconductorRepository(PackageRepository):
         Returns:
             Tuple of (package_info, correct_name) or (None, original_name) if not found
         """
-        # Try different capitalizations
-        variants = [
+        if self._load_release_index():
+            # Not a release software package, so only other package types and devel are left
+            url_patterns = [
+                "https://bioconductor.org/packages/release/data/experiment/html/{}.html",
+                "https://www.bioconductor.org/packages/devel/bioc/html/{}.html"
+            ]
+        else:
+            # Without the index, try every known URL pattern
+            url_patterns = [
+                "https://www.bioconductor.org/packages/release/bioc/html/{}.html",
+                "https://bioconductor.org/packages/release/bioc/html/{}.html",
+                "https://www.bioconductor.org/packages/release/data/experiment/html/{}.html",
+                "https://bioconductor.org/packages/release/data/experiment/html/{}.html",
+                "https://www.bioconductor.org/packages/devel/bioc/html/{}.html"
+            ]
+        
+        # Try different capitalizations, skipping ones identical to an earlier variant
+        variants = list(dict.fromkeys([
             package_name,
             package_name.upper(),
             package_name.lower(),
             package_name.capitalize()
-        ]
-        
-        # Try different URL patterns
-        url_patterns = [
-            "https://www.bioconductor.org/packages/release/bioc/html/{}.html",
-            "https://bioconductor.org/packages/release/bioc/html/{}.html",
-            "https://www.bioconductor.org/packages/release/data/experiment/html/{}.html",
-            "https://bioconductor.org/packages/release/data/experiment/html/{}.html",
-            "https://www.bioconductor.org/packages/devel/bioc/html/{}.html"
-        ]
+        ]))
         
         # Try each combination
         for variant in variants:
@@ -198,7 +250,7 @@ class BioconductorRepository(PackageRepository):
                 
                 try:
                     # Make a HEAD request first to check if the page exists
-                    head_response = requests.head(url, timeout=10)
+                    head_response = self.session.head(url, timeout=10)
                     
                     if head_response.status_code == 200:
                         # print(f"Found package page at {url}")
@@ -233,10 +285,10 @@ class BioconductorRepository(PackageRepository):
             
             for api_url in api_urls:
                 # print(f"Trying API URL: {api_url}")
-                response = requests.get(api_url, timeout=15)
+                response = self.session.get(api_url, timeout=15)
                 
                 if response.status_code == 200:
-                    packages = response.json()
+                    packages = parse_json(response)
                     
                     # Look for case-insensitive match
                     for pkg_name, pkg_info in packages.items():
@@ -248,6 +300,7 @@ class BioconductorRepository(PackageRepository):
             
         return None, package_name
     
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         """
         Enhanced search for a package with improved reliability.
@@ -255,57 +308,28 @@ class BioconductorRepository(PackageRepository):
         """
         # print(f"Searching for Bioconductor package: {package_name}")
         
-        # First try to find the package by direct URL access
-        package_info, correct_name = self._find_package_by_direct_url(package_name)
+        # First look the package up in the release index, which is cached on
+        # disk and answers most software packages without any request
+        package_info, correct_name = None, package_name
+        try:
+            release_index = self._load_release_index()
+            if package_name in release_index:
+                matched_name = package_name
+            else:
+                matched_name = self._find_case_insensitive_match(package_name, self._release_index_map)
+            if matched_name:
+                package_info, correct_name = release_index[matched_name], matched_name
+        except Exception as e:
+            print(f"Error searching release index: {str(e)}")
         
-        # If that fails, try the API
+        # Then try to find the package by direct URL access
         if not package_info:
+            package_info, correct_name = self._find_package_by_direct_url(package_name)
+        
+        # If that fails, try the API; it lists the same release packages as the
+        # index, so it is only worth downloading when the index failed to load
+        if not package_info and not self._release_index:
             package_info, correct_name = self._find_package_via_api(package_name)
-            
-        # If all approaches fail, fall back to the original search method
-        if not package_info:
-            try:
-                # Get initial package list to find correct case
-                initial_packages = self._load_packages(self.versions[-1])
-                
-                if package_name not in initial_packages:
-                    correct_name = self._find_case_insensitive_match(package_name, list(initial_packages.keys()))
-                    if correct_name:
-                        package_name = correct_name
-                
-                # Original search logic using versions
-                all_versions = set()
-                latest_info = None
-                latest_version_number = "0.0"
-                
-                # Search through all versions in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
-                    future_to_version = {
-                        executor.submit(self._load_packages, version): version
-                        for version in self.versions
-                    }
-                    
-                    for future in concurrent.futures.as_completed(future_to_version):
-                        version = future_to_version[future]
-                        try:
-                            packages = future.result()
-                            if package_name in packages:
-                                pkg_info = packages[package_name]
-                                pkg_version = pkg_info.get('Version', '0.0')
-                                all_versions.add(pkg_version)
-                                
-                                # Keep track of the latest version information
-                                if pkg_version > latest_version_number:
-                                    latest_version_number = pkg_version
-                                    latest_info = pkg_info
-                        except Exception as e:
-                            pass
-                
-                if latest_info:
-                    package_info = latest_info
-                    correct_name = package_name
-            except Exception as e:
-                print(f"Error in fallback search: {str(e)}")
         
         # If we still couldn't find the package
         if not package_info:
@@ -318,18 +342,19 @@ class BioconductorRepository(PackageRepository):
         license_info = package_info.get('License', '')
         readme = package_info.get('README', '')
         
-        # Try to get more detailed description if needed
-        if not readme:
+        # Check for threading support
+        has_threading, thread_flags = find_thread_flags(description, readme)
+        
+        # Fetch the README only if the description alone shows no threading support
+        if not readme and not has_threading:
             try:
                 details_url = f"https://bioconductor.org/packages/release/bioc/vignettes/{correct_name}/inst/doc/README"
-                readme_response = requests.get(details_url)
-                readme = readme_response.text if readme_response.status_code == 200 else ''
+                readme_response = self.session.get(details_url, timeout=15)
+                if readme_response.status_code == 200:
+                    has_threading, thread_flags = find_thread_flags(description, readme_response.text)
             except requests.RequestException:
                 pass
         
-        # Check for threading support
-        has_threading, thread_flags = find_thread_flags(description, readme)
-        
         # For packages found via direct URL or API, we might only have one version
         # So create a versions list with at least the current version
         versions = [version]
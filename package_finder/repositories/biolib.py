@@ -1,11 +1,15 @@
 import requests
-from typing import Optional
+import html
 import re
+from typing import Optional
 from bs4 import BeautifulSoup
-from .base import PackageRepository
-from .utils import find_thread_flags
+from .base import PackageRepository, memoize_search
+from .utils import find_thread_flags, HTML_PARSER
 from ..models import PackageInfo
 
+# href of every anchor on a page, e.g. <a class="x" href="/bio-utils/foo">
+_LINK_HREF_RE = re.compile(r'<a\s[^>]*?\bhref\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+
 class BioLibRepository(PackageRepository):
     """BioLib package repository."""
     
@@ -15,61 +19,73 @@ class BioLibRepository(PackageRepository):
     def get_repository_name(self) -> str:
         return "BioLib"
     
+    def _probe_url(self, url: str) -> Optional[int]:
+        """Return the status code of a HEAD request to url, or None if it failed."""
+        try:
+            return self.session.head(url, allow_redirects=True, timeout=10).status_code
+        except requests.RequestException:
+            return None
+    
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         try:
-            # More comprehensive URL variations
-            url_variations = [
+            # More comprehensive URL variations, skipping duplicates for lowercase names
+            url_variations = list(dict.fromkeys([
                 f"{self.base_url}/bio-utils/{package_name.lower()}",
                 f"{self.base_url}/bio-utils/{package_name}",
                 f"{self.base_url}/package/{package_name.lower()}",
                 f"{self.base_url}/package/{package_name}",
                 f"{self.base_url}/{package_name.lower()}",
                 f"{self.base_url}/{package_name}"
-            ]
+            ]))
             
             response = None
             working_url = None
             
-            # Try direct URLs first
-            for url in url_variations:
+            # Try direct URLs first, probing all variations at once; HEAD skips
+            # downloading the 404 pages. Earlier variations still take precedence.
+            probes = [self._fetch_executor.submit(self._probe_url, url) for url in url_variations]
+            for url, probe in zip(url_variations, probes):
+                if probe.result() != 200:
+                    continue
                 try:
-                    response = requests.get(url)
+                    response = self.session.get(url, timeout=10)
                     if response.status_code == 200:
                         working_url = url
                         break
                 except requests.RequestException:
                     continue
             
+            for probe in probes:
+                probe.cancel()
+            
             # If direct access fails, try search
             if not response or response.status_code != 200:
                 search_url = f"{self.base_url}/search"
                 params = {'q': package_name}
                 
                 try:
-                    search_response = requests.get(search_url, params=params)
+                    search_response = self.session.get(search_url, params=params, timeout=10)
                     
                     if search_response.status_code != 200:
                         return None
                     
-                    # Parse search results
-                    soup = BeautifulSoup(search_response.text, 'html.parser')
-                    
-                    # Enhanced search matching
-                    exact_matches = soup.find_all('a', href=re.compile(
-                        f'(/bio-utils/|/package/|/).*{re.escape(package_name)}.*', 
-                        re.IGNORECASE
-                    ))
+                    # Use the first link whose path mentions the package name; only
+                    # one href is needed, so the results page isn't parsed into a tree
+                    package_lower = package_name.lower()
+                    package_url = next((
+                        href for href in _LINK_HREF_RE.findall(search_response.text)
+                        if package_lower in href.lower().partition('/')[2]
+                    ), None)
                     
-                    if not exact_matches:
+                    if package_url is None:
                         return None
                     
-                    # Use first matching result
-                    package_link = exact_matches[0]
-                    package_url = package_link['href']
+                    package_url = html.unescape(package_url)
                     if not package_url.startswith('http'):
                         package_url = self.base_url + package_url
                     
-                    response = requests.get(package_url)
+                    response = self.session.get(package_url, timeout=10)
                     working_url = package_url
                     
                     if response.status_code != 200:
@@ -79,7 +95,7 @@ class BioLibRepository(PackageRepository):
                     return None
             
             # Parse package page
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Extract package information
             title_elem = (
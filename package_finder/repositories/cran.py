@@ -1,54 +1,95 @@
-import requests
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, Dict, Set, Tuple
+import logging
 import re
+import threading
 import time
-from .base import PackageRepository
+from .base import PackageRepository, memoize_search
 from .utils import find_thread_flags
+from ..cache import load_cached_json, save_cached_json
 from ..models import PackageInfo
 
+logger = logging.getLogger(__name__)
+
+# Fields in the table on a package's index.html, e.g. <td>Version:</td>\n<td>1.2.3</td>
+_INDEX_FIELD_RE = re.compile(r'(Version|Description|License):</td>\s*<td>([^<]+)</td>')
+
+_AVAILABLE_PACKAGES_CACHE_NAME = 'cran-available-packages'
+
+# Package links in available_packages_by_name.html, e.g. <a href="../../web/packages/A3/index.html">
+_PACKAGE_LINK_RE = re.compile(r'<a href="[^"]+/([^/]+)/index\.html"')
+_PACKAGE_LINK_FALLBACK_RE = re.compile(r'href="./([^/]+)/index\.html"')
+
+# Source tarballs in an Archive/ listing, e.g. ggplot2_3.4.0.tar.gz
+_ARCHIVE_RE = re.compile(r'([A-Za-z0-9.]+)_([0-9.]+)\.tar\.gz')
+
 class CRANRepository(PackageRepository):
     """CRAN (Comprehensive R Archive Network) package repository."""
     
     def __init__(self, debug=False):
         self.base_url = "https://cran.r-project.org/web/packages"
-        self._available_packages = None
+        self._package_map: Optional[Dict[str, str]] = None
+        self._package_map_lock = threading.Lock()
+        # Kept for compatibility; debug messages go to this module's logger,
+        # which the application configures (package-finder --debug)
         self.debug = debug
     
     def get_repository_name(self) -> str:
         return "CRAN"
     
-    def _print_debug(self, *args, **kwargs):
-        """Print debug information if debug mode is enabled."""
-        if self.debug:
-            print("[CRAN Debug]", *args, **kwargs)
-    
-    def _load_available_packages(self) -> List[str]:
-        """Load and cache the list of available packages from CRAN."""
-        if self._available_packages is None:
-            try:
-                self._print_debug("Loading package list from CRAN...")
-                start_time = time.time()
-                
-                # First try the direct packages page
-                list_response = requests.get(f"{self.base_url}/available_packages_by_name.html", timeout=10)
-                
-                if list_response.status_code == 200:
-                    packages = re.findall(r'<a href="[^"]+/([^/]+)/index\.html"', list_response.text)
-                    if not packages:
-                        # Try alternative pattern
-                        packages = re.findall(r'href="./([^/]+)/index\.html"', list_response.text)
-                    
-                    self._available_packages = packages
-                    self._print_debug(f"Loaded {len(packages)} packages in {time.time() - start_time:.2f}s")
+    def _load_package_map(self) -> Dict[str, str]:
+        """
+        Load and cache CRAN's package names as a {normalized_name: name} map.
+        The listing page is large, so the parsed names are kept on disk for a day.
+        """
+        with self._package_map_lock:
+            if self._package_map is None:
+                packages = load_cached_json(_AVAILABLE_PACKAGES_CACHE_NAME)
+                if packages is not None:
+                    logger.debug("Loaded %d packages from the disk cache", len(packages))
                 else:
-                    self._print_debug(f"Failed to load package list, status code: {list_response.status_code}")
-                    self._available_packages = []
-            except Exception as e:
-                self._print_debug(f"Error loading packages: {e}")
-                self._available_packages = []
+                    packages = []
+                    try:
+                        logger.debug("Loading package list from CRAN...")
+                        start_time = time.time()
+                        
+                        # First try the direct packages page
+                        list_response = self.session.get(f"{self.base_url}/available_packages_by_name.html", timeout=10)
+                        
+                        if list_response.status_code == 200:
+                            packages = _PACKAGE_LINK_RE.findall(list_response.text)
+                            if not packages:
+                                # Try alternative pattern
+                                packages = _PACKAGE_LINK_FALLBACK_RE.findall(list_response.text)
+                            
+                            if packages:
+                                save_cached_json(_AVAILABLE_PACKAGES_CACHE_NAME, packages)
+                            logger.debug("Loaded %d packages in %.2fs", len(packages), time.time() - start_time)
+                        else:
+                            logger.debug("Failed to load package list, status code: %s", list_response.status_code)
+                    except Exception as e:
+                        logger.debug("Error loading packages: %s", e)
+                
+                # Only the map is kept; it is built once per process
+                self._package_map = self._build_case_map(packages)
+            
+            return self._package_map
+    
+    def _fetch_archive_versions(self, package_name: str) -> Set[str]:
+        """Get the versions of a package listed in the CRAN archive."""
+        archive_url = f"https://cran.r-project.org/src/contrib/Archive/{package_name}/"
+        archive_response = self.session.get(archive_url, timeout=10)
+        versions = set()
+        
+        if archive_response.status_code == 200:
+            # Extract versions from archive links
+            versions.update(
+                version for name, version in _ARCHIVE_RE.findall(archive_response.text)
+                if name == package_name
+            )
         
-        return self._available_packages
+        return versions
     
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         """
         Search for a package in CRAN.
@@ -56,88 +97,84 @@ class CRANRepository(PackageRepository):
         """
 
         try:
-            self._print_debug(f"Searching for package: {package_name}")
+            logger.debug("Searching for package: %s", package_name)
+            
+            # The archive listing doesn't depend on the package page, so fetch it alongside
+            archive_future = self._fetch_executor.submit(self._fetch_archive_versions, package_name)
             
-            # First try direct access with the original name
-            response = requests.get(f"{self.base_url}/{package_name}/index.html", timeout=10)
+            # First try direct access with the original name; streamed so a miss
+            # is closed without downloading the error page
+            response = self.session.get(f"{self.base_url}/{package_name}/index.html", timeout=10, stream=True)
             found_direct = response.status_code == 200
+            if not found_direct:
+                response.close()
             
-            self._print_debug(f"Direct access result: {'Found' if found_direct else 'Not found'}")
+            logger.debug("Direct access result: %s", 'Found' if found_direct else 'Not found')
             
             # If direct access failed, try with fuzzy matching
             if not found_direct:
-                available_packages = self._load_available_packages()
+                package_map = self._load_package_map()
                 
-                if not available_packages:
-                    self._print_debug("No available packages list, cannot perform matching")
+                if not package_map:
+                    logger.debug("No available packages list, cannot perform matching")
                     return None
                 
-                # Create a mapping of normalized names to original names
+                # Normalize the search term the same way as the map's keys
                 normalized_package_name = self._normalize_package_name(package_name)
-                self._print_debug(f"Normalized search term: '{package_name}' -> '{normalized_package_name}'")
-                
-                package_map = {}
-                for pkg in available_packages:
-                    norm_pkg = self._normalize_package_name(pkg)
-                    package_map[norm_pkg] = pkg
+                logger.debug("Normalized search term: '%s' -> '%s'", package_name, normalized_package_name)
                 
                 # Try to find a match in the normalized map
                 matched_package = package_map.get(normalized_package_name)
                 
                 if matched_package:
-                    self._print_debug(f"Found case-insensitive match: '{matched_package}'")
+                    logger.debug("Found case-insensitive match: '%s'", matched_package)
                     package_name = matched_package
                     
+                    # The archive is listed under the corrected name too
+                    archive_future.cancel()
+                    archive_future = self._fetch_executor.submit(self._fetch_archive_versions, package_name)
+                    
                     # Try to access the package page with the corrected name
-                    response = requests.get(f"{self.base_url}/{matched_package}/index.html", timeout=10)
+                    response = self.session.get(f"{self.base_url}/{matched_package}/index.html", timeout=10)
                     found_direct = response.status_code == 200
                     
                     if not found_direct:
-                        self._print_debug(f"Failed to access matched package page, status: {response.status_code}")
+                        logger.debug("Failed to access matched package page, status: %s", response.status_code)
                         return None
                 else:
-                    self._print_debug(f"No case-insensitive match found for '{package_name}'")
-                    
-                    # Debugging: show some near matches if any
-                    near_matches = []
-                    for norm_pkg, orig_pkg in package_map.items():
-                        if normalized_package_name in norm_pkg or norm_pkg in normalized_package_name:
-                            near_matches.append((orig_pkg, norm_pkg))
+                    logger.debug("No case-insensitive match found for '%s'", package_name)
                     
-                    if near_matches:
-                        self._print_debug("Possible near matches:")
-                        for orig, norm in near_matches[:5]:  # Show up to 5 near matches
-                            self._print_debug(f"  {orig} (normalized: {norm})")
+                    # Debugging: show some near matches if any (scans every package, so debug only)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        near_matches = []
+                        for norm_pkg, orig_pkg in package_map.items():
+                            if normalized_package_name in norm_pkg or norm_pkg in normalized_package_name:
+                                near_matches.append((orig_pkg, norm_pkg))
+                        
+                        if near_matches:
+                            logger.debug("Possible near matches:")
+                            for orig, norm in near_matches[:5]:  # Show up to 5 near matches
+                                logger.debug("  %s (normalized: %s)", orig, norm)
                     
                     return None
             
             # Parse package details
             content = response.text
             
-            # Extract version using regex
-            version_match = re.search(r'Version:</td>\s*<td>([^<]+)</td>', content)
-            latest_version = version_match.group(1) if version_match else None
+            # Extract version, description and license in one scan, keeping the first of each
+            fields = {}
+            for field, value in _INDEX_FIELD_RE.findall(content):
+                fields.setdefault(field, value)
             
-            # Extract description
-            desc_match = re.search(r'Description:</td>\s*<td>([^<]+)</td>', content)
-            description = desc_match.group(1) if desc_match else None
-            
-            # Extract license
-            license_match = re.search(r'License:</td>\s*<td>([^<]+)</td>', content)
-            license_info = license_match.group(1) if license_match else None
+            latest_version = fields.get('Version')
+            description = fields.get('Description')
+            license_info = fields.get('License')
             
             # Check for threading support
             has_threading, thread_flags = find_thread_flags(description or '')
             
             # Get available versions from CRAN archive
-            archive_url = f"https://cran.r-project.org/src/contrib/Archive/{package_name}/"
-            archive_response = requests.get(archive_url, timeout=10)
-            versions = set()
-            
-            if archive_response.status_code == 200:
-                # Extract versions from archive links
-                archive_versions = re.findall(rf'{package_name}_([0-9.]+)\.tar\.gz', archive_response.text)
-                versions.update(archive_versions)
+            versions = archive_future.result()
             
             # Add current version if it exists
             if latest_version:
@@ -158,9 +195,9 @@ class CRANRepository(PackageRepository):
                 thread_flags=thread_flags
             )
             
-            self._print_debug(f"Successfully found package: {package_name}")
+            logger.debug("Successfully found package: %s", package_name)
             return result
             
         except Exception as e:
-            self._print_debug(f"Error during search: {e}")
+            logger.debug("Error during search: %s", e)
             return None
\ No newline at end of file
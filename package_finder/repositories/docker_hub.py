@@ -1,7 +1,8 @@
 import requests
 from typing import Optional, List
-from .base import PackageRepository
+from .base import PackageRepository, memoize_search
 from .utils import find_thread_flags
+from ..http import parse_json
 from ..models import PackageInfo
 
 class DockerHubRepository(PackageRepository):
@@ -13,6 +14,7 @@ class DockerHubRepository(PackageRepository):
     def get_repository_name(self) -> str:
         return "Docker Hub"
     
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         try:
             # Search for the package
@@ -21,27 +23,32 @@ class DockerHubRepository(PackageRepository):
                 'query': package_name,
                 'page_size': 25
             }
-            response = requests.get(search_url, params=params)
+            response = self.session.get(search_url, params=params, timeout=10)
             
             if response.status_code != 200:
                 return None
                 
-            results = response.json().get('results', [])
+            results = parse_json(response).get('results', [])
             if not results:
                 return None
             
-            # Find best match
-            # First try official images
-            exact_matches = [r for r in results 
-                           if r.get('slug', '').lower() == f"library/{package_name}".lower()]
+            # Find best match in one pass: an official image wins outright,
+            # otherwise the first exact name match, otherwise the first result
+            package_lower = package_name.lower()
+            official_slug = f"library/{package_lower}"
+            name_suffix = f"/{package_lower}"
             
-            # Then try any exact matches
-            if not exact_matches:
-                exact_matches = [r for r in results 
-                               if r.get('slug', '').lower().endswith(f"/{package_name}".lower())]
+            best_match = None
+            for r in results:
+                slug = (r.get('slug') or '').lower()
+                if slug == official_slug:
+                    best_match = r
+                    break
+                if best_match is None and slug.endswith(name_suffix):
+                    best_match = r
             
-            # If no exact matches, take the first result
-            best_match = exact_matches[0] if exact_matches else results[0]
+            if best_match is None:
+                best_match = results[0]
             
             # Extract the full repository name
             repo_name = best_match.get('slug', '')
@@ -54,16 +61,20 @@ class DockerHubRepository(PackageRepository):
                     repo_name = f"{namespace}/{name}"
             
             # Get repository tags
+            # One page of the most recently updated tags instead of the default 10
             tags_url = f"{self.base_url}/repositories/{repo_name}/tags"
-            tags_response = requests.get(tags_url)
+            tags_params = {
+                'page_size': 100,
+                'ordering': 'last_updated'
+            }
+            tags_response = self.session.get(tags_url, params=tags_params, timeout=10)
             
             versions = []
             if tags_response.status_code == 200:
-                tags_data = tags_response.json()
-                versions = [tag['name'] for tag in tags_data.get('results', [])]
+                tag_names = [tag['name'] for tag in parse_json(tags_response).get('results', [])]
                 # Filter out 'latest' tag and sort
-                versions = sorted([v for v in versions if v != 'latest'])
-                if 'latest' in [tag['name'] for tag in tags_data.get('results', [])]:
+                versions = sorted(name for name in tag_names if name != 'latest')
+                if 'latest' in tag_names:
                     versions.append('latest')
             
             description = best_match.get('description', '')
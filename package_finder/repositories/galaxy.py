@@ -1,15 +1,26 @@
 import requests
-from typing import Optional, List, Dict, Tuple
-from .base import PackageRepository
+from typing import Optional, List, Dict, Tuple, Callable
+import threading
+from .base import PackageRepository, memoize_search
 from .utils import find_thread_flags
+from ..cache import load_cached_json, save_cached_json
+from ..http import parse_json
 from ..models import PackageInfo
 
+_TOOL_SHED_CACHE_NAME = 'galaxy-toolshed-tools'
+_GALAXY_TOOLS_CACHE_NAME = 'galaxy-usegalaxy-tools'
+
 class GalaxyRepository(PackageRepository):
     """Galaxy Tool Shed repository."""
     
     def __init__(self):
         self.toolshed_url = "https://toolshed.g2.bx.psu.edu/api"
         self.galaxy_url = "https://usegalaxy.org/api"
+        self._tools: Dict[str, Dict[str, Dict]] = {}
+        self._tools_locks = {
+            _TOOL_SHED_CACHE_NAME: threading.Lock(),
+            _GALAXY_TOOLS_CACHE_NAME: threading.Lock()
+        }
     
     def get_repository_name(self) -> str:
         return "Galaxy Tool Shed"
@@ -19,13 +30,13 @@ class GalaxyRepository(PackageRepository):
         try:
             # Fetch list of all repositories
             repositories_url = f"{self.toolshed_url}/repositories"
-            response = requests.get(repositories_url)
+            response = self.session.get(repositories_url, timeout=30)
             
             if response.status_code != 200:
                 print("Failed to fetch Tool Shed repositories")
                 return {}
             
-            repositories = response.json()
+            repositories = parse_json(response)
             
             # Collect tool information
             tools = {}
@@ -55,13 +66,13 @@ class GalaxyRepository(PackageRepository):
         try:
             # Fetch list of tools from Galaxy API
             tools_url = f"{self.galaxy_url}/tools"
-            response = requests.get(tools_url)
+            response = self.session.get(tools_url, timeout=30)
             
             if response.status_code != 200:
                 print("Failed to fetch Galaxy tools")
                 return {}
             
-            tools_data = response.json()
+            tools_data = parse_json(response)
             
             # Collect tool information
             tools = {}
@@ -81,15 +92,37 @@ class GalaxyRepository(PackageRepository):
             print(f"Error fetching Galaxy tools: {e}")
             return {}
     
+    def _load_tools(self, cache_name: str, fetch_tools: Callable[[], Dict[str, Dict]]) -> Dict[str, Dict]:
+        """
+        Load one source's tools, fetching them at most once per process.
+        Both lists are large, so they are also kept on disk for a day.
+        """
+        with self._tools_locks[cache_name]:
+            if cache_name not in self._tools:
+                tools = load_cached_json(cache_name)
+                if tools is None:
+                    tools = fetch_tools()
+                    # Leave a failed fetch unset so a later search can retry
+                    if not tools:
+                        return tools
+                    save_cached_json(cache_name, tools)
+                self._tools[cache_name] = tools
+            
+            return self._tools[cache_name]
+    
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         """
         Compare Tool Shed and Galaxy tools.
         
         Returns PackageInfo highlighting tool presence across platforms.
         """
-        # Fetch tools from both sources
-        tool_shed_tools = self._fetch_tool_shed_tools()
-        galaxy_tools = self._fetch_galaxy_tools()
+        # Fetch tools from both sources at the same time
+        tool_shed_future = self._fetch_executor.submit(
+            self._load_tools, _TOOL_SHED_CACHE_NAME, self._fetch_tool_shed_tools
+        )
+        galaxy_tools = self._load_tools(_GALAXY_TOOLS_CACHE_NAME, self._fetch_galaxy_tools)
+        tool_shed_tools = tool_shed_future.result()
         
         # Check package presence
         in_tool_shed = package_name in tool_shed_tools
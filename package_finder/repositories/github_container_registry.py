@@ -1,8 +1,11 @@
+import base64
+import os
 import requests
 from typing import Optional, List
 import re
-from .base import PackageRepository
+from .base import PackageRepository, memoize_search
 from .utils import find_thread_flags
+from ..http import parse_json
 from ..models import PackageInfo
 
 class GitHubContainerRegistryRepository(PackageRepository):
@@ -11,12 +14,28 @@ class GitHubContainerRegistryRepository(PackageRepository):
     def __init__(self, token: Optional[str] = None):
         self.base_url = "https://api.github.com"
         self.headers = {}
+        # Authenticated requests get 5000 instead of 60 API calls per hour
+        token = token or os.environ.get('GITHUB_TOKEN')
         if token:
             self.headers['Authorization'] = f'Bearer {token}'
     
     def get_repository_name(self) -> str:
         return "GitHub Container Registry"
     
+    def _fetch_readme(self, owner: str, name: str) -> str:
+        """Get a repository's readme text, or an empty string if unavailable."""
+        readme_url = f"{self.base_url}/repos/{owner}/{name}/readme"
+        readme = ""
+        try:
+            readme_response = self.session.get(readme_url, headers=self.headers, timeout=10)
+            if readme_response.status_code == 200:
+                # Undecodable bytes are replaced rather than discarding the whole readme
+                readme = base64.b64decode(parse_json(readme_response)['content']).decode('utf-8', 'replace')
+        except (requests.RequestException, KeyError, ValueError):
+            pass
+        return readme
+    
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         try:
             # Search for packages
@@ -25,12 +44,12 @@ class GitHubContainerRegistryRepository(PackageRepository):
                 'q': f'{package_name} in:name topic:container',
                 'per_page': 100
             }
-            response = requests.get(search_url, headers=self.headers, params=params)
+            response = self.session.get(search_url, headers=self.headers, params=params, timeout=10)
             
             if response.status_code != 200:
                 return None
             
-            results = response.json().get('items', [])
+            results = parse_json(response).get('items', [])
             if not results:
                 return None
             
@@ -42,27 +61,21 @@ class GitHubContainerRegistryRepository(PackageRepository):
             owner = best_match['owner']['login']
             name = best_match['name']
             
+            # Get readme content alongside the container tags
+            readme_future = self._fetch_executor.submit(self._fetch_readme, owner, name)
+            
             # Get container tags
             packages_url = f"{self.base_url}/users/{owner}/packages/container/{name}/versions"
-            versions_response = requests.get(packages_url, headers=self.headers)
+            versions_response = self.session.get(packages_url, headers=self.headers, timeout=10)
             
             versions = []
             if versions_response.status_code == 200:
-                versions_data = versions_response.json()
+                versions_data = parse_json(versions_response)
                 versions = [v['metadata']['container']['tags'][0] 
                           for v in versions_data 
                           if v.get('metadata', {}).get('container', {}).get('tags')]
             
-            # Get readme content
-            readme_url = f"{self.base_url}/repos/{owner}/{name}/readme"
-            readme = ""
-            try:
-                readme_response = requests.get(readme_url, headers=self.headers)
-                if readme_response.status_code == 200:
-                    import base64
-                    readme = base64.b64decode(readme_response.json()['content']).decode('utf-8')
-            except:
-                pass
+            readme = readme_future.result()
             
             description = best_match.get('description', '')
             
@@ -1,33 +1,85 @@
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
-from .base import PackageRepository
+import threading
+from bisect import bisect_right
+from .base import PackageRepository, memoize_search
 from .utils import find_thread_flags
+from ..cache import load_cached_json, save_cached_json
+from ..http import parse_json
 from ..models import PackageInfo
 
+_FORMULAS_CACHE_NAME = 'homebrew-formulas'
+
+# The only formula fields search_package reads; everything else is dropped after download
+_FORMULA_FIELDS = ('name', 'desc', 'license', 'versions')
+
 class HomebrewRepository(PackageRepository):
     """Homebrew/Linuxbrew-core repository."""
     
     def __init__(self):
         self.base_url = "https://formulae.brew.sh/api"
         self._formula_cache: Dict[str, Any] = {}
+        self._formula_cache_lock = threading.Lock()
+        # Lowercase names in index order, also joined by newlines with each one's start offset
+        self._formula_names: List[str] = []
+        self._formula_names_text = ''
+        self._formula_name_offsets: List[int] = []
         
     def get_repository_name(self) -> str:
         return "Homebrew"
     
     def _load_formulas(self) -> None:
-        """Load and cache formula data."""
-        if not self._formula_cache:
-            try:
-                response = requests.get(f"{self.base_url}/formula.json")
-                if response.status_code == 200:
-                    formulas = response.json()
-                    self._formula_cache = {
+        """
+        Load and cache formula data.
+        formula.json is several megabytes, so a trimmed copy is kept on disk for a day.
+        """
+        with self._formula_cache_lock:
+            if not self._formula_cache:
+                formulas = load_cached_json(_FORMULAS_CACHE_NAME)
+                if formulas is None:
+                    try:
+                        response = self.session.get(f"{self.base_url}/formula.json", timeout=30)
+                        if response.status_code == 200:
+                            formulas = [
+                                {field: formula[field] for field in _FORMULA_FIELDS if field in formula}
+                                for formula in parse_json(response)
+                            ]
+                            save_cached_json(_FORMULAS_CACHE_NAME, formulas)
+                    except requests.RequestException:
+                        formulas = None
+                
+                if formulas:
+                    formula_cache = {
                         formula['name'].lower(): formula for formula in formulas
                     }
-            except requests.RequestException:
-                self._formula_cache = {}
+                    
+                    self._formula_names = list(formula_cache)
+                    self._formula_names_text = '\n'.join(self._formula_names)
+                    self._formula_name_offsets = []
+                    offset = 0
+                    for name in self._formula_names:
+                        self._formula_name_offsets.append(offset)
+                        offset += len(name) + 1
+                    
+                    self._formula_cache = formula_cache
+    
+    def _find_formula_containing(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the first formula whose lowercase name contains text.
+        One str.find over all names replaces a Python loop over every formula.
+        """
+        if '\n' in text:
+            return None
+        
+        position = self._formula_names_text.find(text)
+        if position == -1:
+            return None
+        
+        index = bisect_right(self._formula_name_offsets, position) - 1
+        return self._formula_cache[self._formula_names[index]]
     
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         try:
             self._load_formulas()
@@ -37,25 +89,15 @@ class HomebrewRepository(PackageRepository):
             
             if not formula:
                 # Try case-insensitive search
-                matches = [
-                    f for name, f in self._formula_cache.items()
-                    if package_name.lower() in name
-                ]
-                if matches:
-                    formula = matches[0]
+                formula = self._find_formula_containing(package_name.lower())
             
             if not formula:
                 return None
             
             name = formula['name']
             
-            # Get full formula information
-            formula_url = f"{self.base_url}/formula/{name}.json"
-            response = requests.get(formula_url)
-            if response.status_code == 200:
-                formula_data = response.json()
-            else:
-                formula_data = formula
+            # formula.json already has every field used below, so no per-formula request
+            formula_data = formula
             
             # Get versions
             versions = []
@@ -67,23 +109,24 @@ class HomebrewRepository(PackageRepository):
             
             description = formula_data.get('desc', '')
             
-            # Try to get more detailed description from the repository
-            try:
-                repo_url = f"https://raw.githubusercontent.com/Homebrew/homebrew-core/master/Formula/{name}.rb"
-                repo_response = requests.get(repo_url)
-                if repo_response.status_code == 200:
-                    formula_content = repo_response.text
-                    # Extract detailed description and comments
-                    description_lines = []
-                    for line in formula_content.split('\n'):
-                        if line.strip().startswith('#'):
-                            description_lines.append(line.strip('# '))
-                        elif not line.strip():
-                            break
-                    if description_lines:
-                        description = '\n'.join(description_lines)
-            except requests.RequestException:
-                pass
+            # Only fall back to the formula source if the index has no description
+            if not description:
+                try:
+                    repo_url = f"https://raw.githubusercontent.com/Homebrew/homebrew-core/master/Formula/{name}.rb"
+                    repo_response = self.session.get(repo_url, timeout=10)
+                    if repo_response.status_code == 200:
+                        formula_content = repo_response.text
+                        # Extract detailed description and comments
+                        description_lines = []
+                        for line in formula_content.split('\n'):
+                            if line.strip().startswith('#'):
+                                description_lines.append(line.strip('# '))
+                            elif not line.strip():
+                                break
+                        if description_lines:
+                            description = '\n'.join(description_lines)
+                except requests.RequestException:
+                    pass
             
             # Check for threading support
             has_threading, thread_flags = find_thread_flags(description)
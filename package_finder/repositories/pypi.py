@@ -1,42 +1,98 @@
+import re
 import requests
-from typing import Optional
-from .base import PackageRepository
-from .utils import find_thread_flags
+import threading
+import time
+from typing import Optional, Dict
+from .base import PackageRepository, memoize_search
+from .utils import find_thread_flags, version_sort_key
+from ..cache import load_cached_json, save_cached_json
+from ..http import parse_json
 from ..models import PackageInfo
 
+_PROJECT_NAMES_CACHE_NAME = 'pypi-project-names'
+
+# JSON form of the simple index (PEP 691), much lighter to parse than the HTML page;
+# HTML is still accepted for mirrors and proxies that only serve that
+_SIMPLE_INDEX_JSON = 'application/vnd.pypi.simple.v1+json'
+_SIMPLE_INDEX_ACCEPT = f'{_SIMPLE_INDEX_JSON}, text/html;q=0.1'
+
+# Project links in the HTML simple index, e.g. <a href="/simple/requests/">requests</a>
+_SIMPLE_RE = re.compile(r'<a\s[^>]*>([^<]+)</a>')
+
+# After a failed index download, later misses wait this long before trying again (5 minutes)
+_PROJECT_INDEX_RETRY_AFTER = 5 * 60
+
 class PyPIRepository(PackageRepository):
     """PyPI package repository."""
     
     def __init__(self):
         self.base_url = "https://pypi.org/pypi"
+        self._project_index: Optional[Dict[str, str]] = None
+        self._project_index_lock = threading.Lock()
+        self._project_index_failed_at: Optional[float] = None
     
     def get_repository_name(self) -> str:
         return "PyPI"
     
+    def _load_project_index(self) -> Dict[str, str]:
+        """
+        Load all PyPI project names as a {normalized_name: name} index.
+        The simple index lists every project, so it is fetched at most once per
+        process and kept on disk for a day.
+        """
+        with self._project_index_lock:
+            if self._project_index is None:
+                # Don't download the whole listing again on every miss right after a failure
+                if (self._project_index_failed_at is not None
+                        and time.monotonic() - self._project_index_failed_at < _PROJECT_INDEX_RETRY_AFTER):
+                    return {}
+                
+                project_names = load_cached_json(_PROJECT_NAMES_CACHE_NAME)
+                if project_names is None:
+                    try:
+                        search_response = self.session.get(
+                            "https://pypi.org/simple/",
+                            headers={'Accept': _SIMPLE_INDEX_ACCEPT},
+                            timeout=30
+                        )
+                        if search_response.status_code == 200:
+                            content_type = search_response.headers.get('Content-Type', '')
+                            if content_type.startswith(_SIMPLE_INDEX_JSON):
+                                project_names = [project['name'] for project in parse_json(search_response)['projects']]
+                            else:
+                                project_names = _SIMPLE_RE.findall(search_response.text)
+                            if project_names:
+                                save_cached_json(_PROJECT_NAMES_CACHE_NAME, project_names)
+                            else:
+                                project_names = None
+                    except (requests.RequestException, ValueError, KeyError):
+                        # Unreachable, or a malformed index
+                        pass
+                
+                # Leave the index unset on failure so a later search can retry after a while
+                if project_names is None:
+                    self._project_index_failed_at = time.monotonic()
+                    return {}
+                self._project_index_failed_at = None
+                self._project_index = self._build_case_map(project_names)
+            
+            return self._project_index
+    
+    @memoize_search
     def search_package(self, package_name: str) -> Optional[PackageInfo]:
         try:
             # First try exact match
-            response = requests.get(f"{self.base_url}/{package_name}/json")
+            response = self.session.get(f"{self.base_url}/{package_name}/json", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
             else:
-                # If exact match fails, try simple search
-                search_response = requests.get(f"https://pypi.org/simple/")
-                if search_response.status_code == 200:
-                    # Parse the simple HTML page to get package names
-                    available_packages = [
-                        line.split('>')[-2].split('<')[0]
-                        for line in search_response.text.split('\n')
-                        if 'a href' in line
-                    ]
-                    correct_name = self._find_case_insensitive_match(package_name, available_packages)
-                    if correct_name:
-                        response = requests.get(f"{self.base_url}/{correct_name}/json")
-                        if response.status_code == 200:
-                            data = response.json()
-                            package_name = correct_name  # Use the correct case
-                        else:
-                            return None
+                # If exact match fails, look the name up in the index of all projects
+                correct_name = self._load_project_index().get(self._normalize_package_name(package_name))
+                if correct_name:
+                    response = self.session.get(f"{self.base_url}/{correct_name}/json", timeout=10)
+                    if response.status_code == 200:
+                        data = parse_json(response)
+                        package_name = correct_name  # Use the correct case
                     else:
                         return None
                 else:
@@ -49,13 +105,11 @@ class PyPIRepository(PackageRepository):
             # Check for threading support
             has_threading, thread_flags = find_thread_flags(description, readme)
             
-            # Get all versions including pre-releases
-            versions = list(data['releases'].keys())
-            # Filter out empty releases and sort
-            versions = [v for v in versions if data['releases'][v]]
-            versions.sort(key=lambda x: [int(y) for y in x.split('.')] 
-                        if all(y.isdigit() for y in x.split('.')) 
-                        else [0])
+            # Get all versions including pre-releases, skipping releases without files
+            versions = sorted(
+                (version for version, files in data['releases'].items() if files),
+                key=version_sort_key
+            )
             
             return PackageInfo(
                 name=package_name,
@@ -1,61 +1,117 @@
 import re
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Tuple, List
 
+# BeautifulSoup tree builder: the C-based lxml parser when installed, else the stdlib one
+HTML_PARSER = 'lxml' if find_spec('lxml') is not None else 'html.parser'
+
+_THREAD_KEYWORDS = (
+    '-t', '--threads', '-threads', '--thread', '-thread',
+    '--nthreads', '-nthreads', '--num-threads', '-n',
+    '--cores', '-cores', '--num-cores',
+    '-p', '--processes', '-processes',
+    '--parallel', '-parallel',
+    '--jobs', '-j',
+    '--workers', '-w',
+    '--cpus', '-cpus',
+    '--threads-per-process', '--tpp'
+)
+
+_THREAD_PATTERNS = (
+    r'-t\s*\d+',
+    r'--threads\s*\d+',
+    r'--thread\s*\d+',
+    r'-n\s*\d+',
+    r'--num-threads\s*\d+',
+    r'--cores\s*\d+',
+    r'-p\s*\d+',
+    r'--processes\s*\d+',
+    r'--parallel\s*\d*',
+    r'-j\s*\d+',
+    r'--jobs\s*\d+',
+    r'--workers\s*\d+',
+    r'--cpus\s*\d+',
+    r'--threads-per-process\s*\d+'
+)
+
+_THREADING_INDICATORS = (
+    'parallel', 'multithread', 'multi-thread', 'multi thread',
+    'concurrent', 'cpu cores', 'processor cores',
+    'parallel processing', 'thread pool', 'threadpool',
+    'multithreading', 'parallelization', 'concurrent processing',
+    'distributed computing', 'parallel computation'
+)
+
+# Every keyword, pattern and indicator contains at least one of these, so text
+# without any of them can't match and skips the scans below
+_THREAD_PREFILTER = ('-', 'thread', 'parallel', 'concurrent', 'cores', 'distributed')
+
+# Release numbers with an optional pre/post-release tag, e.g. "1.2.10", "v2.0",
+# "1.2-3" (R), "1.0rc1", "2.0.0-beta.2", "1.0.post1", "3.1.dev0"
+_VERSION_RE = re.compile(
+    r'v?(\d+(?:[.\-_]\d+)*)(?:[.\-_]?(dev|a|alpha|b|beta|c|rc|pre|post)[.\-_]?(\d*))?',
+    re.ASCII | re.IGNORECASE
+)
+_VERSION_SEPARATOR_RE = re.compile(r'[.\-_]')
+
+# Where each tag sorts relative to the plain release (0)
+_VERSION_TAG_RANKS = {
+    'dev': -4,
+    'a': -3, 'alpha': -3,
+    'b': -2, 'beta': -2,
+    'c': -1, 'rc': -1, 'pre': -1,
+    'post': 1
+}
+
+# Flag patterns and threading indicators in one alternation, so each call scans the
+# text once; a match sets whichever named group it came from
+_THREAD_TEXT_RE = re.compile(
+    '(?P<flag>' + '|'.join(_THREAD_PATTERNS) + ')'
+    '|(?P<indicator>' + '|'.join(re.escape(word) for word in _THREADING_INDICATORS) + ')'
+)
+
 def find_thread_flags(description: str, readme: str = None) -> Tuple[bool, List[str]]:
     """
     Analyze package description and readme for threading support.
     Returns (has_threading, thread_flags).
     """
-    thread_keywords = {
-        '-t', '--threads', '-threads', '--thread', '-thread',
-        '--nthreads', '-nthreads', '--num-threads', '-n',
-        '--cores', '-cores', '--num-cores',
-        '-p', '--processes', '-processes', 
-        '--parallel', '-parallel',
-        '--jobs', '-j', 
-        '--workers', '-w',
-        '--cpus', '-cpus',
-        '--threads-per-process', '--tpp'
-    }
-    
-    thread_patterns = [
-        r'-t\s*\d+',
-        r'--threads\s*\d+',
-        r'--thread\s*\d+',
-        r'-n\s*\d+',
-        r'--num-threads\s*\d+',
-        r'--cores\s*\d+'
-        r'-p\s*\d+',
-        r'--processes\s*\d+',
-        r'--parallel\s*\d*',
-        r'-j\s*\d+',
-        r'--jobs\s*\d+',
-        r'--workers\s*\d+',
-        r'--cpus\s*\d+',
-        r'--threads-per-process\s*\d+'
-    ]
-    
-    text_to_search = (description or '').lower() + ' ' + (readme or '').lower()
-    
-    found_flags = set()
-    
-    for keyword in thread_keywords:
-        if keyword in text_to_search:
-            found_flags.add(keyword)
-    
-    for pattern in thread_patterns:
-        if re.search(pattern, text_to_search):
-            matches = re.findall(pattern, text_to_search)
-            found_flags.update(matches)
-    
-    threading_indicators = [
-        'parallel', 'multithread', 'multi-thread', 'multi thread', 
-        'concurrent', 'cpu cores', 'processor cores',
-        'parallel processing', 'thread pool', 'threadpool',
-        'multithreading', 'parallelization', 'concurrent processing',
-        'distributed computing', 'parallel computation'
-    ]
+    text_to_search = f"{description or ''} {readme or ''}".lower()
+
+    if not any(needle in text_to_search for needle in _THREAD_PREFILTER):
+        return False, []
+
+    # Every keyword starts with '-', so text without one skips the keyword scans
+    if '-' in text_to_search:
+        found_flags = {keyword for keyword in _THREAD_KEYWORDS if keyword in text_to_search}
+    else:
+        found_flags = set()
+
+    has_threading = False
+    for match in _THREAD_TEXT_RE.finditer(text_to_search):
+        flag = match.group('flag')
+        if flag is not None:
+            found_flags.add(flag)
+        else:
+            has_threading = True
+
+    return has_threading or len(found_flags) > 0, list(found_flags)
+
+@lru_cache(maxsize=4096)
+def version_sort_key(version: str) -> Tuple[Tuple[int, ...], Tuple[int, int]]:
+    """
+    Sort key for version strings.
+    Releases compare numerically ignoring trailing zeros ("1.0" == "1.0.0"), pre-releases
+    sort before their release and post-releases after it; anything else sorts first.
+    """
+    match = _VERSION_RE.fullmatch(version)
+    if not match:
+        return (), (0, 0)
     
-    has_threading = any(word in text_to_search for word in threading_indicators)
+    release = [int(part) for part in _VERSION_SEPARATOR_RE.split(match.group(1))]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
     
-    return has_threading or len(found_flags) > 0, list(found_flags)
\ No newline at end of file
+    tag, number = match.group(2), match.group(3)
+    tag_key = (_VERSION_TAG_RANKS[tag.lower()], int(number or 0)) if tag else (0, 0)
+    return tuple(release), tag_key
@@ -1,8 +1,11 @@
 from typing import List, Dict
 import concurrent.futures
+import itertools
+import time
 from .models import PackageInfo
 from collections import defaultdict
 import re
+from .repositories.utils import version_sort_key
 from .repositories import (
     BiocondaRepository,
     AnacondaRepository,
@@ -19,9 +22,18 @@ from .repositories import (
     HomebrewRepository
 )
 
+# Minimum time between progress line updates, in seconds
+_PROGRESS_INTERVAL = 0.1
+
+# Leading major.minor of a version string, e.g. "1.2" in "1.2.3"
+_MAJOR_MINOR_RE = re.compile(r'(\d+\.\d+)')
+
 class PackageSearcher:
     """Main class to coordinate package searches across multiple repositories."""
     
+    # Shared by all instances so repeated searches reuse the same worker threads
+    _search_executor = concurrent.futures.ThreadPoolExecutor(max_workers=32)
+    
     def __init__(self, repositories=None):
         self.repositories = repositories or [
             BiocondaRepository(),
@@ -53,54 +65,59 @@ class PackageSearcher:
         Returns:
             Dictionary mapping package names to lists of PackageInfo objects
         """
+        # A name given more than once is only searched once
         results: Dict[str, List[PackageInfo]] = {name: [] for name in package_names}
-        total_searches = len(package_names) * len(self.repositories)
+        total_searches = len(results) * len(self.repositories)
         completed = 0
+        last_progress = -1
+        last_progress_time = 0.0
+        
+        print(f"\nSearching for {len(results)} packages across {len(self.repositories)} repositories...")
         
-        print(f"\nSearching for {len(package_names)} packages across {len(self.repositories)} repositories...")
+        # Create futures for all package-repository combinations
+        future_to_search = {
+            self._search_executor.submit(repo.search_package, pkg_name): (pkg_name, repo)
+            for pkg_name, repo in itertools.product(results, self.repositories)
+        }
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, total_searches)) as executor:
-            # Create futures for all package-repository combinations
-            future_to_search = {
-                executor.submit(repo.search_package, pkg_name): (pkg_name, repo)
-                for pkg_name in package_names
-                for repo in self.repositories
-            }
+        # Process results as they complete
+        for future in concurrent.futures.as_completed(future_to_search):
+            pkg_name, repo = future_to_search[future]
+            completed += 1
             
-            # Process results as they complete
-            for future in concurrent.futures.as_completed(future_to_search):
-                pkg_name, repo = future_to_search[future]
-                completed += 1
-                
-                try:
-                    result = future.result()
-                    if result:
-                        # Only add if the package name matches or the result contains meaningful information
-                        is_generic_result = (
-                            result.name.lower() == 'biolib' or  # Catch the generic BioLib result
-                            (not result.versions and not result.description)  # Or if it's essentially empty
-                        )
-                        
-                        if not is_generic_result:
-                            results[pkg_name].append(result)
-                    
-                    # Update progress
-                    progress = (completed * 100) // total_searches
-                    print(f"\rProgress: {progress}% ({completed}/{total_searches} searches completed)", end="")
+            try:
+                result = future.result()
+                if result:
+                    # Only add if the package name matches or the result contains meaningful information
+                    is_generic_result = (
+                        result.name.lower() == 'biolib' or  # Catch the generic BioLib result
+                        (not result.versions and not result.description)  # Or if it's essentially empty
+                    )
                     
-                except Exception as e:
-                    print(f"\nError searching {repo.get_repository_name()} for {pkg_name}: {e}")
+                    if not is_generic_result:
+                        results[pkg_name].append(result)
+                
+                # Update progress at most every _PROGRESS_INTERVAL seconds, and always on the last search
+                progress = (completed * 100) // total_searches
+                now = time.monotonic()
+                if completed == total_searches or (
+                    progress != last_progress and now - last_progress_time >= _PROGRESS_INTERVAL
+                ):
+                    print(f"\rProgress: {progress}% ({completed}/{total_searches} searches completed)", end="", flush=True)
+                    last_progress = progress
+                    last_progress_time = now
+                
+            except Exception as e:
+                print(f"\nError searching {repo.get_repository_name()} for {pkg_name}: {e}")
         
         print("\nSearch completed!")
         return results
 
-from collections import defaultdict
-import re
-
 def get_major_minor(version: str) -> str:
     """Extract major.minor from version string."""
-    version = version.lower().replace('v', '')
-    match = re.match(r'(\d+\.\d+)', version)
+    if version[:1] in ('v', 'V'):
+        version = version[1:]
+    match = _MAJOR_MINOR_RE.match(version)
     return match.group(1) if match else version
 
 def format_version_groups(version_groups: dict) -> str:
@@ -134,27 +151,25 @@ def print_package_info(package_info: PackageInfo) -> None:
         has_latest = 'latest' in package_info.versions
         versions = [v for v in package_info.versions if v != 'latest']
         
-        # Sort versions
-        try:
-            sorted_versions = sorted(versions, 
-                                   key=lambda x: [int(y) for y in x.replace('v','').replace('V','').split('.')] 
-                                   if all(y.isdigit() for y in x.replace('v','').replace('V','').split('.')) 
-                                   else [0])
-        except:
-            sorted_versions = sorted(versions)
-        
-        # Get counts and groups
+        # Group by major.minor and find the latest version in one pass;
+        # of equal versions the last listed wins, as with a stable sort
         version_groups = defaultdict(list)
         total_versions = len(versions)
+        latest_version = None
+        latest_key = None
         
         for version in versions:
             major_minor = get_major_minor(version)
             version_groups[major_minor].append(version)
+            
+            key = version_sort_key(version)
+            if latest_key is None or key >= latest_key:
+                latest_version, latest_key = version, key
         
         major_minor_count = len(version_groups)
         
         # Print version information
-        print(f"Latest version: {sorted_versions[-1] if sorted_versions else 'unknown'}")
+        print(f"Latest version: {latest_version if latest_version is not None else 'unknown'}")
         print(f"Version counts: {major_minor_count} major.minor, {total_versions} total")
         
         # Print concise version groups
@@ -9,6 +9,10 @@ setup(
         "beautifulsoup4>=4.9.3",
         "typing>=3.7.4",
     ],
+    extras_require={
+        'cache': ["requests-cache>=1.0"],
+        'speedups': ["orjson>=3.0"],
+    },
     entry_points={
         'console_scripts': [
             'package-finder=package_finder.cli:main',